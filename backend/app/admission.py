@@ -0,0 +1,302 @@
+# backend/app/admission.py
+
+import itertools
+import os
+import time
+from dataclasses import dataclass
+from typing import Dict, Optional, Set
+from . import logger
+
+# Consecutive failed generations after which the backend is considered down
+MAX_CONSECUTIVE_FAILURES = 3
+# Seconds to shed debates after the backend went down before letting one probe through
+FAILURE_BACKOFF = 30.0
+# Floor for any Retry-After we report, so clients never spin on 0
+MIN_RETRY_AFTER = 1.0
+
+
+@dataclass
+class Admission:
+    """Outcome of an admission request. Debate settings may be degraded under load."""
+    admitted: bool
+    reason: str = ""
+    retry_after: float = 0.0
+    rounds: int = 0
+    num_predict: int = 0
+    degraded: bool = False
+    ticket: Optional[int] = None
+
+    def to_event(self) -> dict:
+        if not self.admitted:
+            return {
+                "type": "rejected",
+                "reason": self.reason,
+                "retry_after": round(self.retry_after, 1)
+            }
+        return {
+            "type": "admitted",
+            "data": {
+                "rounds": self.rounds,
+                "num_predict": self.num_predict,
+                "degraded": self.degraded,
+                "reason": self.reason
+            }
+        }
+
+
+class AdmissionController:
+    """
+    Bounds in-flight GPU work for /ws/debate and /api/transcribe.
+
+    Debates are rejected when the client exceeds its rate limit, when its
+    lane is full, or when the backend keeps failing. Normal clients cannot
+    use the slots reserved for allow-listed priority hosts. The last
+    `degrade_slots` slots of a lane, or a backend whose measured latency
+    approaches the generation timeout, admit debates with fewer rounds and a
+    smaller num_predict instead.
+    """
+
+    def __init__(
+        self,
+        max_concurrent_debates: int = 3,
+        reserved_high_priority: int = 1,
+        degrade_slots: int = 1,
+        priority_hosts: Optional[Set[str]] = None,
+        max_concurrent_transcriptions: int = 2,
+        rate_limit_per_minute: int = 3,
+        generate_timeout: float = 60.0,
+        default_num_predict: int = 920,
+        degraded_num_predict: int = 400,
+        degraded_rounds: int = 2,
+        clock=time.monotonic
+    ):
+        self.max_concurrent_debates = max(1, max_concurrent_debates)
+        self.reserved_high_priority = max(0, min(reserved_high_priority, self.max_concurrent_debates - 1))
+        normal_lane = self.max_concurrent_debates - self.reserved_high_priority
+        self.degrade_slots = max(0, min(degrade_slots, normal_lane - 1))
+        self.priority_hosts = set(priority_hosts or ())
+        self.max_concurrent_transcriptions = max(1, max_concurrent_transcriptions)
+        self.rate_limit_per_minute = max(1, rate_limit_per_minute)
+        self.generate_timeout = generate_timeout
+        self.default_num_predict = default_num_predict
+        self.degraded_num_predict = degraded_num_predict
+        self.degraded_rounds = degraded_rounds
+        self._clock = clock
+
+        self.active_transcriptions = 0
+        # Seconds per generated token (from Ollama's eval_count) and typical answer length
+        self.latency_per_token: Optional[float] = None
+        self.answer_tokens: Optional[float] = None
+        self.consecutive_failures = 0
+        self.last_failure_at: Optional[float] = None
+        self.transcription_latency: Optional[float] = None
+        self._buckets: Dict[str, tuple] = {}
+        # ticket -> (started_at, planned generate calls, num_predict)
+        self._in_flight: Dict[int, tuple] = {}
+        self._tickets = itertools.count(1)
+
+    @classmethod
+    def from_env(cls) -> "AdmissionController":
+        """Build a controller from DEBATE_* environment variables, falling back to defaults."""
+        def _int(name: str, default: int) -> int:
+            try:
+                return int(os.getenv(name, default))
+            except ValueError:
+                logger.warning(f"Invalid value for {name}, using {default}")
+                return default
+
+        hosts = os.getenv("DEBATE_PRIORITY_HOSTS", "")
+        settings = dict(
+            max_concurrent_debates=_int("DEBATE_MAX_CONCURRENT", 3),
+            reserved_high_priority=_int("DEBATE_RESERVED_PRIORITY_SLOTS", 1),
+            degrade_slots=_int("DEBATE_DEGRADE_SLOTS", 1),
+            priority_hosts={h.strip() for h in hosts.split(",") if h.strip()},
+            max_concurrent_transcriptions=_int("TRANSCRIBE_MAX_CONCURRENT", 2),
+            rate_limit_per_minute=_int("DEBATE_RATE_LIMIT_PER_MINUTE", 3),
+            generate_timeout=_int("DEBATE_GENERATE_TIMEOUT", 60),
+            default_num_predict=_int("DEBATE_NUM_PREDICT", 920),
+            degraded_num_predict=_int("DEBATE_DEGRADED_NUM_PREDICT", 400),
+            degraded_rounds=_int("DEBATE_DEGRADED_ROUNDS", 2)
+        )
+        controller = cls(**settings)
+        for name, attr in (
+            ("DEBATE_MAX_CONCURRENT", "max_concurrent_debates"),
+            ("DEBATE_RESERVED_PRIORITY_SLOTS", "reserved_high_priority"),
+            ("DEBATE_DEGRADE_SLOTS", "degrade_slots")
+        ):
+            if getattr(controller, attr) != settings[attr]:
+                logger.warning(f"{name}={settings[attr]} adjusted to {getattr(controller, attr)}")
+        return controller
+
+    @staticmethod
+    def _ewma(current: Optional[float], sample: float, alpha: float = 0.3) -> float:
+        return sample if current is None else alpha * sample + (1 - alpha) * current
+
+    @property
+    def active_debates(self) -> int:
+        return len(self._in_flight)
+
+    def record_generation(self, seconds: float, tokens: int, num_predict: int):
+        """Feed one completed generate call; `tokens` is Ollama's eval_count."""
+        self.consecutive_failures = 0
+        if tokens <= 0:
+            return
+        self.latency_per_token = self._ewma(self.latency_per_token, seconds / tokens)
+        if tokens < num_predict:
+            # Ended on its own, so this is the natural answer length
+            self.answer_tokens = self._ewma(self.answer_tokens, tokens)
+        elif num_predict >= self.default_num_predict:
+            self.answer_tokens = self._ewma(self.answer_tokens, self.default_num_predict)
+
+    def record_timeout(self, num_predict: int):
+        """A timed out call did not produce its expected answer within the timeout."""
+        self.consecutive_failures = 0
+        tokens = min(num_predict, self.answer_tokens or num_predict)
+        self.latency_per_token = self._ewma(self.latency_per_token, self.generate_timeout / max(1, tokens))
+
+    def record_failure(self):
+        """Failed calls carry no latency signal; count them to detect a dead backend."""
+        self.consecutive_failures += 1
+        self.last_failure_at = self._clock()
+
+    def record_transcription(self, seconds: float):
+        self.transcription_latency = self._ewma(self.transcription_latency, seconds)
+
+    def expected_call_latency(self, num_predict: int) -> Optional[float]:
+        """Expected duration of one generate call capped at num_predict."""
+        if self.latency_per_token is None:
+            return None
+        tokens = min(num_predict, self.answer_tokens or num_predict)
+        return self.latency_per_token * tokens
+
+    def expected_latency(self) -> Optional[float]:
+        """Expected duration of one full-size generate call."""
+        return self.expected_call_latency(self.default_num_predict)
+
+    def priority_for(self, client_id: str) -> str:
+        return "high" if client_id in self.priority_hosts else "normal"
+
+    def _take_token(self, client_id: str) -> float:
+        """Token bucket per client. Returns 0 if allowed, else seconds until the next token."""
+        now = self._clock()
+        capacity = float(self.rate_limit_per_minute)
+        refill_rate = capacity / 60.0
+
+        # Buckets that have refilled to capacity carry no state worth keeping
+        idle = [
+            cid for cid, (tokens, last) in self._buckets.items()
+            if cid != client_id and tokens + (now - last) * refill_rate >= capacity
+        ]
+        for cid in idle:
+            del self._buckets[cid]
+
+        tokens, last = self._buckets.get(client_id, (capacity, now))
+        tokens = min(capacity, tokens + (now - last) * refill_rate)
+        if tokens < 1:
+            self._buckets[client_id] = (tokens, now)
+            return (1 - tokens) / refill_rate
+        self._buckets[client_id] = (tokens - 1, now)
+        return 0.0
+
+    def _backend_slow(self) -> bool:
+        expected = self.expected_latency()
+        return expected is not None and expected > 0.75 * self.generate_timeout
+
+    def _backend_down_for(self) -> float:
+        """Seconds left in the failure backoff, or 0 if debates may be admitted."""
+        if self.consecutive_failures < MAX_CONSECUTIVE_FAILURES:
+            return 0.0
+        return max(0.0, self.last_failure_at + FAILURE_BACKOFF - self._clock())
+
+    def _next_slot_in(self) -> float:
+        """Seconds until the earliest in-flight debate is expected to finish."""
+        now = self._clock()
+        finishes = []
+        for started, calls, num_predict in self._in_flight.values():
+            per_call = self.expected_call_latency(num_predict) or self.generate_timeout
+            finish = started + calls * per_call
+            if finish <= now:
+                # Overran the estimate; every call is still bounded by the timeout
+                finish = started + calls * self.generate_timeout
+            finishes.append(finish)
+        if not finishes:
+            return MIN_RETRY_AFTER
+        return max(MIN_RETRY_AFTER, min(finishes) - now)
+
+    def try_admit_debate(self, client_id: str, rounds: int) -> Admission:
+        down_for = self._backend_down_for()
+        if down_for:
+            logger.warning(f"Debate rejected for {client_id}: backend failing")
+            return Admission(
+                admitted=False,
+                reason="Model backend is unavailable",
+                retry_after=max(MIN_RETRY_AFTER, down_for)
+            )
+
+        limit = self.max_concurrent_debates
+        if self.priority_for(client_id) == "normal":
+            limit -= self.reserved_high_priority
+        if self.active_debates >= limit:
+            logger.warning(f"Debate rejected for {client_id}: {self.active_debates} debates in flight")
+            return Admission(
+                admitted=False,
+                reason="Server is at capacity, please try again shortly",
+                retry_after=self._next_slot_in()
+            )
+
+        wait = self._take_token(client_id)
+        if wait:
+            logger.warning(f"Debate rejected for {client_id}: rate limit exceeded")
+            return Admission(
+                admitted=False,
+                reason="Rate limit exceeded",
+                retry_after=wait
+            )
+
+        busy = self.active_debates >= limit - self.degrade_slots
+        slow = self._backend_slow()
+        admission = Admission(admitted=True, rounds=rounds, num_predict=self.default_num_predict)
+
+        if busy or slow:
+            admission.degraded = True
+            admission.rounds = min(rounds, self.degraded_rounds)
+            admission.num_predict = self.degraded_num_predict
+            admission.reason = "Backend is slow" if slow else "Server is busy"
+            logger.info(f"Debate for {client_id} degraded: {admission.reason}")
+
+        # Two speakers per round plus the judge's verdict
+        admission.ticket = next(self._tickets)
+        self._in_flight[admission.ticket] = (self._clock(), 2 * admission.rounds + 1, admission.num_predict)
+        return admission
+
+    def release_debate(self, admission: Admission):
+        self._in_flight.pop(admission.ticket, None)
+
+    def try_admit_transcription(self) -> bool:
+        if self.active_transcriptions >= self.max_concurrent_transcriptions:
+            logger.warning("Transcription rejected: server at capacity")
+            return False
+        self.active_transcriptions += 1
+        return True
+
+    def release_transcription(self):
+        self.active_transcriptions = max(0, self.active_transcriptions - 1)
+
+    def transcription_retry_after(self) -> int:
+        """Transcriptions run one at a time, so a new one waits behind everything admitted."""
+        if self.transcription_latency is None:
+            return 10
+        return max(1, round(self.transcription_latency * self.active_transcriptions))
+
+    def status(self) -> dict:
+        expected = self.expected_latency()
+        return {
+            "active_debates": self.active_debates,
+            "max_concurrent_debates": self.max_concurrent_debates,
+            "active_transcriptions": self.active_transcriptions,
+            "rate_limited_clients": len(self._buckets),
+            "backend_latency": round(expected, 2) if expected is not None else None
+        }
+
+
+admission = AdmissionController.from_env()
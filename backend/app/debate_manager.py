@@ -2,8 +2,10 @@ import ollama
 import asyncio
 from typing import Dict, List, AsyncGenerator
 from .chroma_handler import ChromaHandler
+from .admission import admission
 from . import logger
 import re
+import time
 
 class DebateManager:
     def __init__(self):
@@ -87,7 +89,7 @@ class DebateManager:
         text = re.sub(r"(?i)^assistant: ?", "", text)
         return text.strip()
 
-    async def stream_debate(self, topic: str = None, rounds: int = 5) -> AsyncGenerator[dict, None]:
+    async def stream_debate(self, topic: str = None, rounds: int = 5, num_predict: int = 920) -> AsyncGenerator[dict, None]:
         transcript = []
         try:
             client = ollama.AsyncClient()
@@ -95,7 +97,7 @@ class DebateManager:
 
             for round_num in range(1, rounds + 1):
                 logger.info(f"Streaming round {round_num}")
-                round_data = await self._conduct_round(topic, round_num)
+                round_data = await self._conduct_round(topic, round_num, num_predict)
                 transcript.append(round_data)
 
                 try:
@@ -105,7 +107,7 @@ class DebateManager:
 
                 yield {"type": "round_update", "data": round_data}
 
-            verdict = await self._get_verdict(topic, transcript)
+            verdict = await self._get_verdict(topic, transcript, num_predict)
             yield {"type": "verdict", "data": {"topic": topic, "verdict": verdict}}
 
         except Exception as e:
@@ -174,7 +176,7 @@ class DebateManager:
             self.active_models.remove(model)
            
 
-    async def _conduct_round(self, topic: str, round_num: int) -> Dict:
+    async def _conduct_round(self, topic: str, round_num: int, num_predict: int = 920) -> Dict:
         try:
             first, second = ("pro", "con") if round_num % 2 == 1 else ("con", "pro")
 
@@ -183,13 +185,13 @@ class DebateManager:
 
             # Load, generate, unload first model
             model_first = await self._load_model(first)
-            raw_response_1 = await self._generate_response(model_first, prompt_1, self.model_config[first]["system_prompt"])
+            raw_response_1 = await self._generate_response(model_first, prompt_1, self.model_config[first]["system_prompt"], num_predict)
             response_1 = self._clean_response(raw_response_1)
             await self._unload_model(model_first)
 
             prompt_2 = f"{intro_line}Your opponent said:\n\"{response_1}\"\nNow it's your turn. Present a strong counter:"
             model_second = await self._load_model(second)
-            raw_response_2 = await self._generate_response(model_second, prompt_2, self.model_config[second]["system_prompt"])
+            raw_response_2 = await self._generate_response(model_second, prompt_2, self.model_config[second]["system_prompt"], num_predict)
             response_2 = self._clean_response(raw_response_2)
             await self._unload_model(model_second)
 
@@ -216,7 +218,8 @@ class DebateManager:
                 "metadata": {"topic": topic, "round": round_num, }
             }
 
-    async def _generate_response(self, model_name: str, prompt: str, system: str) -> str:
+    async def _generate_response(self, model_name: str, prompt: str, system: str, num_predict: int = 920) -> str:
+        started = time.monotonic()
         try:
             client = ollama.AsyncClient()
             result = await asyncio.wait_for(
@@ -227,20 +230,23 @@ class DebateManager:
                     options={
                         "temperature": 0.7,
                         "num_ctx": 4026,
-                        "num_predict": 920
+                        "num_predict": num_predict
                     }
                 ),
-                timeout=60
+                timeout=admission.generate_timeout
             )
+            admission.record_generation(time.monotonic() - started, result.get("eval_count", 0), num_predict)
             return result.get("response", "[No response]")
         except asyncio.TimeoutError:
             logger.warning(f"{model_name} timed out.")
+            admission.record_timeout(num_predict)
             return "[Timed out]"
         except Exception as e:
             logger.error(f"{model_name} failed: {str(e)}")
+            admission.record_failure()
             return f"[Error: {str(e)}]"
 
-    async def _get_verdict(self, topic: str, transcript: List[Dict]) -> str:
+    async def _get_verdict(self, topic: str, transcript: List[Dict], num_predict: int = 920) -> str:
         try:
             judge_model = await self._load_model("judge")
 
@@ -252,7 +258,7 @@ class DebateManager:
                 f"Debate Topic: {topic}\n{rounds_summary}\n\n"
                 "Judge: Who argued more effectively across all rounds? Justify your answer and clearly state the winner."
             )
-            verdict_raw = await self._generate_response(judge_model, final_prompt, self.model_config["judge"]["system_prompt"])
+            verdict_raw = await self._generate_response(judge_model, final_prompt, self.model_config["judge"]["system_prompt"], num_predict)
             await self._unload_model(judge_model)
             return self._clean_response(verdict_raw)
         except Exception as e:
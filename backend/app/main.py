@@ -12,6 +12,7 @@ from . import __version__, logger
 from .debate_manager import DebateManager
 from .models import OllamaWrapper
 from .chroma_handler import ChromaHandler
+from .admission import admission
 
 app = FastAPI(
     title="AI Debate Platform",
@@ -52,6 +53,7 @@ async def startup_event():
 @app.websocket("/ws/debate")
 async def websocket_debate(websocket: WebSocket):
     await websocket.accept()
+    client_id = websocket.client.host if websocket.client else "unknown"
     try:
         while True:
             data = await websocket.receive_text()
@@ -66,15 +68,26 @@ async def websocket_debate(websocket: WebSocket):
                 topic = message.get("topic")
                 rounds = min(5, int(message.get("rounds", 5)))
 
+                ticket = admission.try_admit_debate(client_id, rounds)
+                await websocket.send_json(ticket.to_event())
+                if not ticket.admitted:
+                    continue
+
                 try:
-                    async for event in manager.stream_debate(topic=topic, rounds=rounds):
+                    async for event in manager.stream_debate(
+                        topic=topic, rounds=ticket.rounds, num_predict=ticket.num_predict
+                    ):
                         await websocket.send_json(event)
+                except WebSocketDisconnect:
+                    raise
                 except Exception as e:
                     logger.error(f"Debate failed: {str(e)}")
                     await websocket.send_json({
                         "type": "error",
                         "message": str(e)
                     })
+                finally:
+                    admission.release_debate(ticket)
 
             elif message.get("action") == "get_history":
                 try:
@@ -105,7 +118,8 @@ async def health_check():
     return {
         "status": "healthy" if await llm.health_check() else "unhealthy",
         "version": __version__,
-        "models_loaded": list(manager.active_models)
+        "models_loaded": list(manager.active_models),
+        "load": admission.status()
     }
 
 @app.get("/api/history")
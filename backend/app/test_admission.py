@@ -0,0 +1,190 @@
+# test_admission.py
+import pytest
+from app.admission import AdmissionController
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+def make_controller(clock, **kwargs):
+    options = dict(
+        max_concurrent_debates=3,
+        reserved_high_priority=1,
+        degrade_slots=1,
+        rate_limit_per_minute=100,
+        clock=clock
+    )
+    options.update(kwargs)
+    return AdmissionController(**options)
+
+
+def test_normal_lane_degrades_before_rejecting(clock):
+    ctl = make_controller(clock)
+
+    first = ctl.try_admit_debate("a", 5)
+    assert first.admitted and not first.degraded
+    assert first.rounds == 5 and first.num_predict == ctl.default_num_predict
+
+    second = ctl.try_admit_debate("b", 5)
+    assert second.admitted and second.degraded
+    assert second.rounds == ctl.degraded_rounds
+    assert second.num_predict == ctl.degraded_num_predict
+    assert second.reason == "Server is busy"
+
+    third = ctl.try_admit_debate("c", 5)
+    assert not third.admitted
+    assert third.to_event()["type"] == "rejected"
+
+
+def test_reserved_slot_only_for_priority_hosts(clock):
+    ctl = make_controller(clock, priority_hosts={"10.0.0.1"})
+    ctl.try_admit_debate("a", 5)
+    ctl.try_admit_debate("b", 5)
+
+    assert not ctl.try_admit_debate("c", 5).admitted
+    vip = ctl.try_admit_debate("10.0.0.1", 5)
+    assert vip.admitted and vip.degraded
+    assert not ctl.try_admit_debate("10.0.0.1", 5).admitted
+
+
+def test_release_frees_slot(clock):
+    ctl = make_controller(clock)
+    first = ctl.try_admit_debate("a", 5)
+    second = ctl.try_admit_debate("b", 5)
+    ctl.release_debate(first)
+    assert ctl.try_admit_debate("c", 5).admitted
+
+    ctl.release_debate(second)
+    ctl.release_debate(second)
+    assert ctl.active_debates == 1
+
+
+def test_degrade_slots_clamped_to_lane(clock):
+    ctl = make_controller(clock, degrade_slots=5)
+    assert ctl.degrade_slots == 1
+    assert not ctl.try_admit_debate("a", 5).degraded
+
+
+def test_capacity_retry_after_tracks_in_flight_work(clock):
+    ctl = make_controller(clock, reserved_high_priority=0, degrade_slots=0, max_concurrent_debates=1)
+    ctl.record_generation(10.0, 500, 920)
+
+    ctl.try_admit_debate("a", 3)
+    clock.now += 20
+    rejected = ctl.try_admit_debate("b", 3)
+    # 3 rounds x 2 speakers + verdict at 10 s per call, 20 s already elapsed
+    assert rejected.retry_after == pytest.approx(50.0)
+
+    # Once the estimate is overrun, fall back to the per-call timeout bound
+    clock.now += 100
+    assert ctl.try_admit_debate("b", 3).retry_after == pytest.approx(7 * 60 - 120)
+
+
+def test_rate_limit_refills(clock):
+    ctl = make_controller(clock, rate_limit_per_minute=2, max_concurrent_debates=10)
+    assert ctl.try_admit_debate("a", 1).admitted
+    assert ctl.try_admit_debate("a", 1).admitted
+
+    limited = ctl.try_admit_debate("a", 1)
+    assert not limited.admitted
+    assert limited.reason == "Rate limit exceeded"
+    assert limited.retry_after == pytest.approx(30.0)
+
+    # Other clients have their own bucket
+    assert ctl.try_admit_debate("b", 1).admitted
+
+    clock.now += 30
+    assert ctl.try_admit_debate("a", 1).admitted
+
+
+def test_idle_buckets_are_evicted(clock):
+    ctl = make_controller(clock, rate_limit_per_minute=2, max_concurrent_debates=10)
+    for i in range(5):
+        ctl.release_debate(ctl.try_admit_debate(f"client-{i}", 1))
+    assert ctl.status()["rate_limited_clients"] == 5
+
+    clock.now += 60
+    ctl.try_admit_debate("late", 1)
+    assert ctl.status()["rate_limited_clients"] == 1
+
+
+def test_slow_backend_degrades(clock):
+    ctl = make_controller(clock, generate_timeout=60)
+    ctl.record_generation(25.0, 500, 920)
+    assert not ctl.try_admit_debate("a", 5).degraded
+
+    for _ in range(3):
+        ctl.record_timeout(920)
+    slow = ctl.try_admit_debate("b", 5)
+    assert slow.degraded and slow.reason == "Backend is slow"
+
+
+def test_recovers_from_degraded_mode(clock):
+    ctl = make_controller(clock, generate_timeout=60)
+    ctl.record_generation(25.0, 500, 920)
+    for _ in range(3):
+        ctl.record_timeout(920)
+
+    debate = ctl.try_admit_debate("a", 5)
+    assert debate.degraded
+    # Degraded calls finish at the healthy rate, some ending early, some hitting the cap
+    for tokens in (300, 400, 350, 400, 380):
+        ctl.record_generation(tokens * 0.05, tokens, debate.num_predict)
+    ctl.release_debate(debate)
+
+    healthy = ctl.try_admit_debate("a", 5)
+    assert not healthy.degraded
+    assert healthy.num_predict == ctl.default_num_predict
+
+
+def test_failing_backend_sheds_then_probes(clock):
+    ctl = make_controller(clock)
+    ctl.record_generation(10.0, 500, 920)
+    for _ in range(3):
+        ctl.record_failure()
+    # Near-instant failures must not make the backend look fast
+    assert ctl.expected_latency() == pytest.approx(10.0)
+
+    down = ctl.try_admit_debate("a", 5)
+    assert not down.admitted
+    assert down.reason == "Model backend is unavailable"
+    assert down.retry_after == pytest.approx(30.0)
+
+    clock.now += 30
+    assert ctl.try_admit_debate("a", 5).admitted
+
+
+def test_transcription_cap_and_retry_after(clock):
+    ctl = make_controller(clock, max_concurrent_transcriptions=1)
+    assert ctl.transcription_retry_after() == 10
+
+    assert ctl.try_admit_transcription()
+    assert not ctl.try_admit_transcription()
+    ctl.record_transcription(24.4)
+    assert ctl.transcription_retry_after() == 24
+    ctl.release_transcription()
+
+    assert ctl.try_admit_transcription()
+
+
+def test_from_env(monkeypatch):
+    monkeypatch.setenv("DEBATE_MAX_CONCURRENT", "6")
+    monkeypatch.setenv("DEBATE_PRIORITY_HOSTS", "127.0.0.1, 10.0.0.2")
+    monkeypatch.setenv("DEBATE_NUM_PREDICT", "not-a-number")
+    monkeypatch.setenv("DEBATE_DEGRADE_SLOTS", "9")
+
+    ctl = AdmissionController.from_env()
+    assert ctl.max_concurrent_debates == 6
+    assert ctl.priority_hosts == {"127.0.0.1", "10.0.0.2"}
+    assert ctl.default_num_predict == 920
+    assert ctl.degrade_slots == 4
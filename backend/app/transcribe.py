@@ -1,27 +1,46 @@
 from fastapi import APIRouter, UploadFile, File, HTTPException
 import whisper
+import asyncio
 import tempfile
+import time
 import shutil
 import os
+from .admission import admission
 
 router = APIRouter()
 
 
 model = whisper.load_model("small")  
+# Whisper's KV-cache hooks live on the shared decoder, so only one transcribe may run at a time
+model_lock = asyncio.Lock()
+
+
+def _save_upload(upload: UploadFile) -> str:
+    with tempfile.NamedTemporaryFile(delete=False, suffix=".wav") as tmp_file:
+        shutil.copyfileobj(upload.file, tmp_file)
+        return tmp_file.name
 
 @router.post("/api/transcribe")
 async def transcribe_audio(file: UploadFile = File(...)):
     if not file.content_type.startswith("audio/"):
         raise HTTPException(status_code=400, detail="Invalid file type. Please upload an audio file.")
 
+    if not admission.try_admit_transcription():
+        raise HTTPException(
+            status_code=503,
+            detail="Server is at capacity, please try again shortly",
+            headers={"Retry-After": str(admission.transcription_retry_after())}
+        )
+
     try:
-        # Save uploaded file temporarily
-        with tempfile.NamedTemporaryFile(delete=False, suffix=".wav") as tmp_file:
-            shutil.copyfileobj(file.file, tmp_file)
-            tmp_file_path = tmp_file.name
+        # Save uploaded file temporarily, off the event loop
+        tmp_file_path = await asyncio.to_thread(_save_upload, file)
 
-        # Run whisper transcription
-        result = model.transcribe(tmp_file_path)
+        # Run whisper transcription in a worker thread so debates keep streaming
+        async with model_lock:
+            started = time.monotonic()
+            result = await asyncio.to_thread(model.transcribe, tmp_file_path)
+            admission.record_transcription(time.monotonic() - started)
 
         # Clean up temp file
         os.remove(tmp_file_path)
@@ -33,3 +52,5 @@ async def transcribe_audio(file: UploadFile = File(...)):
         }
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Transcription failed: {str(e)}")
+    finally:
+        admission.release_transcription()
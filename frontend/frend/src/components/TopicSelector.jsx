@@ -23,6 +23,7 @@ const TopicSelector = () => {
     verdict, 
     topic: currentTopic, 
     error,
+    notice,
     mode 
   } = useDebate();
 
@@ -299,6 +300,16 @@ const TopicSelector = () => {
           </div>
         )}
 
+        {/* Load Notice Display */}
+        {notice && (
+          <div className="bg-gradient-to-r from-yellow-50 to-amber-50 border border-yellow-400 rounded-2xl p-4 mb-6 shadow-md">
+            <div className="flex items-center gap-3">
+              <span className="text-2xl">⏳</span>
+              <span className="text-yellow-800 font-medium">{notice}</span>
+            </div>
+          </div>
+        )}
+
         {/* Error Display */}
         {error && (
           <div className="bg-gradient-to-r from-red-50 to-pink-50 border border-red-400 rounded-2xl p-4 mb-6 shadow-md">
@@ -9,6 +9,7 @@ export const DebateProvider = ({ children }) => {
   const [verdict, setVerdict] = useState('');
   const [topic, setTopic] = useState('');
   const [error, setError] = useState(null);
+  const [notice, setNotice] = useState(null);
   const [mode, setMode] = useState('user');
 
   const wsRef = useRef(null);
@@ -20,6 +21,7 @@ const setDebateTopic = (newTopic) => {
   setIsDebating(true);
   setTopic(newTopic);
   setError(null); 
+  setNotice(null);
 
   // Create new WebSocket
   const ws = new WebSocket('ws://localhost:8000/ws/debate');
@@ -34,12 +36,20 @@ const setDebateTopic = (newTopic) => {
   // Handle messages
   ws.onmessage = (event) => {
     const message = JSON.parse(event.data);
-    if (message.type === 'round_update') {
+    if (message.type === 'admitted') {
+      if (message.data.degraded) {
+        setNotice(`${message.data.reason}: running ${message.data.rounds} rounds with shorter answers.`);
+      }
+    } else if (message.type === 'round_update') {
       setTranscript((prev) => [...prev, message.data]);
     } else if (message.type === 'verdict') {
       setVerdict(message.data.verdict);
       setIsDebating(false);
       ws.close();
+    } else if (message.type === 'rejected') {
+      setError(`${message.reason}. Retry in ${Math.ceil(message.retry_after)}s.`);
+      setIsDebating(false);
+      ws.close();
     } else if (message.type === 'error') {
       setError(message.message);
       setIsDebating(false);
@@ -68,6 +78,7 @@ const setDebateTopic = (newTopic) => {
         verdict,
         topic,
         error,
+        notice,
         mode,
         setMode
       }}